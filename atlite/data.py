@@ -25,7 +25,7 @@ logger = logging.getLogger(__name__)
 from atlite.datasets import modules as datamodules
 
 
-def get_features(cutout, module, features, tmpdir=None):
+def get_features(cutout, module, features, tmpdir=None, concurrent_requests=False):
     """
     Load the feature data for a given module.
 
@@ -39,7 +39,12 @@ def get_features(cutout, module, features, tmpdir=None):
 
     for feature in features:
         feature_data = delayed(get_data)(
-            cutout, feature, tmpdir=tmpdir, lock=lock, **parameters
+            cutout,
+            feature,
+            tmpdir=tmpdir,
+            lock=lock,
+            concurrent_requests=concurrent_requests,
+            **parameters,
         )
         datasets.append(feature_data)
 
@@ -115,6 +120,7 @@ def cutout_prepare(
     tmpdir=None,
     overwrite=False,
     compression={"zlib": True, "complevel": 9, "shuffle": True},
+    concurrent_requests=False,
 ):
     """
     Prepare all or a selection of features in a cutout.
@@ -147,6 +153,14 @@ def cutout_prepare(
         To efficiently reduce cutout sizes, specify the number of 'least_significant_digits': n here.
         To disable compression, set "complevel" to None.
         Default is {'zlib': True, 'complevel': 9, 'shuffle': True}.
+    concurrent_requests : bool/int, optional
+        Whether to post the data requests of a module concurrently instead of
+        one after another. Only affects modules which split their retrieval
+        into several requests, e.g. the monthly requests of ERA5. An int sets
+        the maximum number of requests in flight per feature, True uses a
+        small module default (4 for ERA5). Since features are retrieved in
+        parallel, the total number of requests in flight can be up to the
+        number of features times this value. The default is False.
 
     Returns
     -------
@@ -174,7 +188,13 @@ def cutout_prepare(
             continue
         logger.info(f"Calculating and writing with module {module}:")
         missing_features = missing_vars.index.unique("feature")
-        ds = get_features(cutout, module, missing_features, tmpdir=tmpdir)
+        ds = get_features(
+            cutout,
+            module,
+            missing_features,
+            tmpdir=tmpdir,
+            concurrent_requests=concurrent_requests,
+        )
         prepared |= set(missing_features)
 
         cutout.data.attrs.update(dict(prepared_features=list(prepared)))
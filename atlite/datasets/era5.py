@@ -14,9 +14,9 @@ import logging
 import os
 import warnings
 import weakref
+from concurrent.futures import ThreadPoolExecutor
 from tempfile import mkstemp
 
-import cdsapi
 import numpy as np
 import pandas as pd
 import xarray as xr
@@ -59,6 +59,9 @@ features = {
 
 static_features = {"height"}
 
+# Number of CDS requests posted at once per feature with concurrent_requests=True
+DEFAULT_CONCURRENT_REQUESTS = 4
+
 
 def _add_height(ds):
     """
@@ -118,7 +121,7 @@ def get_data_wind(retrieval_params):
     )
     ds = _rename_and_clean_coords(ds)
 
-    ds["wnd100m"] = np.sqrt(ds["u100"] ** 2 + ds["v100"] ** 2).assign_attrs(
+    ds["wnd100m"] = np.hypot(ds["u100"], ds["v100"]).assign_attrs(
         units=ds["u100"].attrs["units"], long_name="100 metre wind speed"
     )
     # span the whole circle: 0 is north, π/2 is east, -π is south, 3π/2 is west
@@ -314,6 +317,8 @@ def retrieve_data(product, chunks=None, tmpdir=None, lock=None, **updates):
         request
     ), "Need to specify at least 'variable', 'year' and 'month'"
 
+    import cdsapi
+
     client = cdsapi.Client(
         info_callback=logger.debug, debug=logging.DEBUG >= logging.root.level
     )
@@ -343,14 +348,20 @@ def retrieve_data(product, chunks=None, tmpdir=None, lock=None, **updates):
     # Fixes issue by keeping "float32" encoded as "float32" instead of internally saving as "short int", see:
     # https://stackoverflow.com/questions/75755441/why-does-saving-to-netcdf-without-encoding-change-some-values-to-nan
     # and hopefully fixed soon (could then remove), see https://github.com/pydata/xarray/issues/7691
-    for v in ds.data_vars:
+    # Decode the packed short ints to float32 rather than float64 to halve their
+    # in-memory size. The rounding error of the cast stays below the packing
+    # resolution of the source data.
+    for v in list(ds.data_vars):
         if ds[v].encoding["dtype"] == "int16":
             ds[v].encoding.clear()
+            ds[v] = ds[v].astype("float32")
 
     return ds
 
 
-def get_data(cutout, feature, tmpdir, lock=None, **creation_parameters):
+def get_data(
+    cutout, feature, tmpdir, lock=None, concurrent_requests=False, **creation_parameters
+):
     """
     Retrieve data from ECMWFs ERA5 dataset (via CDS).
 
@@ -365,6 +376,13 @@ def get_data(cutout, feature, tmpdir, lock=None, **creation_parameters):
         `atlite.datasets.era5.features`
     tmpdir : str/Path
         Directory where the temporary netcdf files are stored.
+    lock : dask.utils.SerializableLock, optional
+        Lock guarding the creation and download of the temporary files.
+    concurrent_requests : bool/int, optional
+        Whether to post the monthly requests concurrently to the CDS instead
+        of one after another. An int sets the maximum number of requests in
+        flight for this feature, True uses `DEFAULT_CONCURRENT_REQUESTS` (4).
+        The default is False.
     **creation_parameters :
         Additional keyword arguments. The only effective argument is 'sanitize'
         (default True) which sets sanitization of the data on or off.
@@ -401,6 +419,14 @@ def get_data(cutout, feature, tmpdir, lock=None, **creation_parameters):
     if feature in static_features:
         return retrieve_once(retrieval_times(coords, static=True)).squeeze()
 
-    datasets = map(retrieve_once, retrieval_times(coords))
+    if concurrent_requests:
+        if concurrent_requests is True:
+            max_workers = DEFAULT_CONCURRENT_REQUESTS
+        else:
+            max_workers = int(concurrent_requests)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            datasets = list(executor.map(retrieve_once, retrieval_times(coords)))
+    else:
+        datasets = map(retrieve_once, retrieval_times(coords))
 
     return xr.concat(datasets, dim="time").sel(time=coords["time"])
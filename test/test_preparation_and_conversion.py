@@ -59,6 +59,9 @@ def update_feature_test(cutout, red):
     red.data = cutout.data.drop_vars("influx_direct")
     red.prepare("influx", overwrite=True)
     assert_equal(red.data.influx_direct, cutout.data.influx_direct)
+    # merging and writing must preserve mixed float32 and float64 variables
+    for v in cutout.data:
+        assert red.data[v].dtype == cutout.data[v].dtype
 
 
 def merge_test(cutout, other, target_modules):
@@ -412,6 +415,15 @@ def cutout_era5_2days_crossing_months(tmp_path_factory):
     return cutout
 
 
+@pytest.fixture(scope="session")
+def cutout_era5_2days_crossing_months_concurrent(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("era5")
+    time = slice("2013-02-28", "2013-03-01")
+    cutout = Cutout(path=tmp_path / "era5", module="era5", bounds=BOUNDS, time=time)
+    cutout.prepare(concurrent_requests=True)
+    return cutout
+
+
 @pytest.fixture(scope="session")
 def cutout_era5_coarse(tmp_path_factory):
     tmp_path = tmp_path_factory.mktemp("era5_coarse")
@@ -539,6 +551,18 @@ class TestERA5:
         """
         assert np.isfinite(cutout_era5_weird_resolution.data).all()
 
+    @staticmethod
+    def test_packed_variables_float32_era5(cutout_era5):
+        """
+        Packed ERA5 variables should be decoded to float32 and stay valid
+        in derived variables.
+        """
+        for v in ["temperature", "wnd100m", "influx_direct"]:
+            assert cutout_era5.data[v].dtype == np.float32
+        assert cutout_era5.data.wnd100m.notnull().all()
+        assert cutout_era5.data.albedo.notnull().all()
+        all_notnull_test(cutout_era5)
+
     @staticmethod
     def test_dx_dy_preservation_era5(cutout_era5):
         """
@@ -592,6 +616,26 @@ class TestERA5:
     def test_prepared_features_era5(cutout_era5):
         return prepared_features_test(cutout_era5)
 
+    @staticmethod
+    def test_prepared_features_era5_concurrent(
+        cutout_era5_2days_crossing_months_concurrent,
+    ):
+        return prepared_features_test(cutout_era5_2days_crossing_months_concurrent)
+
+    @staticmethod
+    def test_concurrent_requests_era5(
+        cutout_era5_2days_crossing_months,
+        cutout_era5_2days_crossing_months_concurrent,
+    ):
+        """
+        Concurrently posted monthly requests should give the same data as
+        sequential ones.
+        """
+        assert_equal(
+            cutout_era5_2days_crossing_months_concurrent.data,
+            cutout_era5_2days_crossing_months.data,
+        )
+
     @staticmethod
     @pytest.mark.skipif(
         sys.platform == "win32", reason="NetCDF update not working on windows"